@@ -1,11 +1,25 @@
 """
 Service for modernizing Java code
 """
-from typing import List
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Optional
 
 from domain.entities import ModernizationResult, JavaFile
+from domain.exceptions import FileProcessingError
 from infrastructure.file_system import JavaFileRepository
 from infrastructure.stackspot_client import StackspotApiClient
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Banners precomputed once instead of rebuilt on every print
+_SEPARATOR = '=' * 60
+_HASH_LINE = '#' * 60
 
 
 class ModernizationService:
@@ -21,6 +35,15 @@ class ModernizationService:
         self.file_repository = file_repository
         self.api_client = api_client
         self.results: List[ModernizationResult] = []
+        self._results_lock = threading.Lock()
+        # Modernized output keyed by content hash: identical files (e.g.
+        # the same DTO copied across modules) hit the API only once
+        self._content_cache: dict = {}
+
+    @staticmethod
+    def _content_key(content: str) -> str:
+        """Hash file content for duplicate detection"""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
     def modernize_file(
         self,
@@ -28,10 +51,21 @@ class ModernizationService:
         save_changes: bool = True
     ) -> ModernizationResult:
         """Modernize a single Java file"""
-        print(f"\n{'=' * 60}")
-        print(f"📄 Processing: {java_file.relative_path}")
-        print(f"   Size: {java_file.size_in_bytes} bytes")
-        print(f"{'=' * 60}")
+        # One record per banner instead of four writes
+        logger.info(
+            "\n%s\n📄 Processing: %s\n   Size: %s bytes\n%s",
+            _SEPARATOR, java_file.relative_path, java_file.size_in_bytes,
+            _SEPARATOR
+        )
+
+        key = self._content_key(java_file.content)
+        cached = self._content_cache.get(key)
+        if cached is not None:
+            logger.info(
+                "⚡ Duplicate content, reusing modernized result: %s",
+                java_file.relative_path
+            )
+            return self._finalize_result(java_file, None, cached, save_changes)
 
         # Execute modernization
         try:
@@ -57,6 +91,111 @@ class ModernizationService:
                 execution_id
             )
 
+        if modernized_content:
+            self._content_cache[key] = modernized_content
+
+        return self._finalize_result(
+            java_file,
+            execution_id,
+            modernized_content,
+            save_changes
+        )
+
+    def _submit_all(
+        self,
+        file_paths: List[Path],
+        save_changes: bool
+    ) -> tuple:
+        """
+        Submit a quick command for every file back-to-back (phase 1)
+
+        Submitting everything up front lets the server work on all files
+        at once instead of one at a time, so the poll wait is paid once
+        for the whole batch rather than once per file.
+
+        Each file is read just before its submission and the content is
+        released right after, so peak memory tracks the file in flight
+        rather than the whole repository. Identical contents are
+        submitted only once: later copies are served from the content
+        cache or attached to the in-flight execution of the first copy.
+
+        Returns:
+            (pending, duplicates, resolved) where pending maps
+            execution_id -> (content key, content-free JavaFile stub),
+            duplicates maps execution_id -> stubs sharing that content,
+            and resolved lists results decided without an API call
+            (read failures, submit failures, cache hits)
+        """
+        pending = {}
+        duplicates = {}
+        resolved = []
+        in_flight = {}
+
+        for file_path in file_paths:
+            try:
+                java_file = self.file_repository.read_java_file(file_path)
+            except FileProcessingError as e:
+                resolved.append(
+                    self._create_failed_result(str(file_path), str(e))
+                )
+                continue
+
+            key = self._content_key(java_file.content)
+
+            cached = self._content_cache.get(key)
+            if cached is not None:
+                logger.info(
+                    "⚡ Duplicate content, reusing modernized result: %s",
+                    java_file.relative_path
+                )
+                resolved.append(
+                    self._finalize_result(java_file, None, cached, save_changes)
+                )
+                continue
+
+            if key in in_flight:
+                logger.info(
+                    "⚡ Duplicate content, sharing execution: %s",
+                    java_file.relative_path
+                )
+                duplicates.setdefault(in_flight[key], []).append(
+                    replace(java_file, content=None)
+                )
+                continue
+
+            logger.info(
+                "📤 Submitting: %s (%s bytes)",
+                java_file.relative_path, java_file.size_in_bytes
+            )
+            try:
+                execution_id = self.api_client.execute_quick_command(
+                    self.QUICK_COMMAND_SLUG,
+                    java_file.content
+                )
+            except Exception as e:
+                resolved.append(
+                    self._create_failed_result(
+                        java_file.absolute_path,
+                        f"Failed to execute command: {e}"
+                    )
+                )
+                continue
+
+            # Drop the content while the execution is in flight; the
+            # harvest phase re-reads it from disk for the comparison
+            in_flight[key] = execution_id
+            pending[execution_id] = (key, replace(java_file, content=None))
+
+        return pending, duplicates, resolved
+
+    def _finalize_result(
+        self,
+        java_file: JavaFile,
+        execution_id: str,
+        modernized_content: Optional[str],
+        save_changes: bool
+    ) -> ModernizationResult:
+        """Turn a polled execution result into a ModernizationResult"""
         if not modernized_content:
             return self._create_failed_result(
                 java_file.absolute_path,
@@ -64,14 +203,36 @@ class ModernizationService:
                 execution_id
             )
 
-        # Save changes if requested
-        if save_changes:
+        original_content = java_file.content
+        if original_content is None:
+            # Content was released after submission; re-read the original
+            # from disk before it is overwritten below
+            try:
+                original_content = self.file_repository.read_java_file(
+                    Path(java_file.absolute_path)
+                ).content
+            except FileProcessingError:
+                original_content = None
+
+        # O(1) length check short-circuits the byte compare for the
+        # common case where the modernization actually changed something
+        unchanged = (
+            original_content is not None and
+            len(modernized_content) == len(original_content) and
+            modernized_content == original_content
+        )
+
+        # Save changes if requested (and there is something to save:
+        # rewriting identical bytes only churns mtimes and git status)
+        if save_changes and unchanged:
+            logger.info("⏭️  No changes, skipping write: %s", java_file.relative_path)
+        elif save_changes:
             try:
                 self.file_repository.save_file(
                     java_file.absolute_path,
                     modernized_content
                 )
-                print(f"💾 File updated: {java_file.absolute_path}")
+                logger.info("💾 File updated: %s", java_file.absolute_path)
             except Exception as e:
                 return self._create_failed_result(
                     java_file.absolute_path,
@@ -83,40 +244,88 @@ class ModernizationService:
             file_path=java_file.absolute_path,
             is_successful=True,
             execution_id=execution_id,
-            original_content=java_file.content,
+            original_content=original_content,
             modernized_content=modernized_content
         )
 
-        self.results.append(result)
+        if save_changes:
+            # The modernized text is on disk now; free both in-memory
+            # copies so peak RSS does not grow with the batch size
+            result.release_contents()
+
+        with self._results_lock:
+            self.results.append(result)
         return result
 
-    def modernize_all_files(self, save_changes: bool = True) -> dict:
-        """Modernize all Java files in repository"""
-        print(f"\n{'#' * 60}")
-        print(f"🚀 STARTING MODERNIZATION")
-        print(f"{'#' * 60}\n")
+    def modernize_all_files(
+        self,
+        save_changes: bool = True,
+        max_workers: Optional[int] = None
+    ) -> dict:
+        """Modernize all Java files in repository concurrently"""
+        logger.info("\n%s\n🚀 STARTING MODERNIZATION\n%s\n", _HASH_LINE, _HASH_LINE)
 
         summary = self.file_repository.get_summary()
-        print(f"📊 Total Java files found: {summary['total_files']}")
-        print(f"📊 Total size: {summary['total_size_bytes']} bytes\n")
+        logger.info("📊 Total Java files found: %s", summary['total_files'])
+        logger.info("📊 Total size: %s bytes\n", summary['total_size_bytes'])
 
         if summary['total_files'] == 0:
-            print("⚠️ No Java files found!")
+            logger.warning("⚠️ No Java files found!")
             return self._create_empty_stats()
 
+        if max_workers is None:
+            # Each file is an I/O-bound API call, so oversubscribe the CPUs
+            # up to the configured concurrency cap
+            max_workers = min(settings.MAX_PARALLEL, (os.cpu_count() or 1) * 4)
+
         processed = 0
         successful = 0
         failed = 0
 
-        for java_file in self.file_repository.get_all_java_files():
-            result = self.modernize_file(java_file, save_changes)
-            processed += 1
+        # Largest files first (LPT scheduling): the biggest jobs start
+        # earliest so small ones fill the tail under concurrency, instead
+        # of a large straggler dominating the makespan
+        java_paths = sorted(
+            self.file_repository.find_all_java_files(),
+            key=lambda f: f.stat().st_size,
+            reverse=True
+        )
+
+        # Phase 1: submit every execution before polling any of them,
+        # so the server processes the whole batch concurrently
+        pending, duplicates, resolved = self._submit_all(java_paths, save_changes)
 
+        for result in resolved:
+            processed += 1
             if result.is_successful:
                 successful += 1
             else:
                 failed += 1
 
+        # Phase 2: harvest results as executions complete
+        for execution_id, modernized_content in self.api_client.gather_results(
+            pending,
+            max_workers=max(1, min(max_workers, len(pending) or 1))
+        ):
+            key, stub = pending[execution_id]
+            if modernized_content:
+                self._content_cache[key] = modernized_content
+
+            # Files that shared this content get the same result
+            for java_file in (stub, *duplicates.get(execution_id, ())):
+                result = self._finalize_result(
+                    java_file,
+                    execution_id,
+                    modernized_content,
+                    save_changes
+                )
+                processed += 1
+
+                if result.is_successful:
+                    successful += 1
+                else:
+                    failed += 1
+
         return self._create_stats(
             summary['total_files'],
             processed,
@@ -137,7 +346,8 @@ class ModernizationService:
             execution_id=execution_id,
             error_message=error_message
         )
-        self.results.append(result)
+        with self._results_lock:
+            self.results.append(result)
         return result
 
     def _create_empty_stats(self) -> dict:
@@ -168,14 +378,13 @@ class ModernizationService:
             'success_rate': success_rate
         }
 
-        print(f"\n{'#' * 60}")
-        print(f"✅ MODERNIZATION COMPLETED")
-        print(f"{'#' * 60}")
-        print(f"📊 Total files: {stats['total_files']}")
-        print(f"✅ Successful: {stats['successful']}")
-        print(f"❌ Failed: {stats['failed']}")
-        print(f"📈 Success rate: {stats['success_rate']}")
-        print(f"{'#' * 60}\n")
+        logger.info(
+            "\n%s\n✅ MODERNIZATION COMPLETED\n%s\n"
+            "📊 Total files: %s\n✅ Successful: %s\n❌ Failed: %s\n"
+            "📈 Success rate: %s\n%s\n",
+            _HASH_LINE, _HASH_LINE, stats['total_files'], stats['successful'],
+            stats['failed'], stats['success_rate'], _HASH_LINE
+        )
 
         return stats
 
@@ -1,6 +1,7 @@
 """
 Execution orchestrator
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from domain.entities import ExecutionResult, StepResult
@@ -12,6 +13,7 @@ from application.steps import (
     CallbackStep,
     ResultStep
 )
+from infrastructure.stackspot_client import StackspotApiClient
 from config.settings import settings
 
 
@@ -22,24 +24,38 @@ class ExecutionOrchestrator:
         self.mode = mode
         self.dev_execution_id = dev_execution_id
         self.result = ExecutionResult()
+        self._api_client: Optional[StackspotApiClient] = None
 
-    def execute(self) -> ExecutionResult:
+    def _get_api_client(self) -> StackspotApiClient:
+        """Create the shared API client on first use"""
+        if self._api_client is None:
+            self._api_client = StackspotApiClient(str(settings.CREDENTIALS_PATH))
+        return self._api_client
+
+    def execute(self, project_path: Optional[str] = None) -> ExecutionResult:
         """
         Execute the complete flow based on mode
 
+        Args:
+            project_path: Optional path to an already-cloned project; when
+                given, the clone step is skipped so one orchestrator (and
+                its warm API client) can be reused across a batch
+
         Returns:
             ExecutionResult with complete execution data
         """
+        self.result = ExecutionResult()
+
         if self.mode.is_dev:
             return self._execute_dev_mode()
-        return self._execute_prod_mode()
+        return self._execute_prod_mode(project_path)
 
     def _execute_dev_mode(self) -> ExecutionResult:
         """Execute development mode (steps 4-5 only)"""
         print("\n⚡ Development Mode: Skipping Steps 1-3")
 
         # Step 4: Fetch callback
-        callback_step = CallbackStep()
+        callback_step = CallbackStep(api_client=self._get_api_client())
         callback_result = callback_step.execute(self.dev_execution_id)
 
         if not callback_result.success:
@@ -50,9 +66,9 @@ class ExecutionOrchestrator:
         self.result.execution_id = self.dev_execution_id
         self.result.callback_file = callback_result.data['callback_file']
 
-        # Step 5: Process results
+        # Step 5: Process results (pass the in-memory dict, skip re-reading)
         result_step = ResultStep()
-        processing_result = result_step.execute(callback_result.data['callback_file'])
+        processing_result = result_step.execute(callback_result.data['callback_result'])
 
         if processing_result.success:
             self.result.results_directory = processing_result.data['output_dir']
@@ -62,15 +78,40 @@ class ExecutionOrchestrator:
 
         return self.result
 
-    def _execute_prod_mode(self) -> ExecutionResult:
+    def _execute_prod_mode(self, project_path: Optional[str] = None) -> ExecutionResult:
         """Execute production mode (all steps)"""
-        # Step 1: Clone repository
-        clone_result = self._execute_clone_step()
-        if not clone_result.success:
-            return self.result
+        collection_step = CollectionStep()
+        prefetched_paths = None
+
+        if project_path:
+            # Batch mode: the project is already on disk, skip the clone
+            self.result.cloned_repo_path = project_path
+            cloned_repo_path = project_path
+        else:
+            # Step 1: Clone repository; while git is busy with network I/O,
+            # warm up the API client (credentials read + OAuth exchange)
+            # and pre-parse the paths file so steps 2-3 start warm
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                warmup = executor.submit(self._get_api_client)
+                paths_future = executor.submit(collection_step.prefetch_paths)
+                clone_result = self._execute_clone_step()
+                try:
+                    warmup.result()
+                except Exception:
+                    # Client construction errors surface in step 3, where
+                    # the step machinery reports them properly
+                    pass
+                prefetched_paths = paths_future.result()
+
+            if not clone_result.success:
+                return self.result
+
+            cloned_repo_path = clone_result.data
 
         # Step 2: Collect files
-        collection_result = self._execute_collection_step(clone_result.data)
+        collection_result = self._execute_collection_step(
+            cloned_repo_path, collection_step, prefetched_paths
+        )
         if not collection_result.success:
             return self.result
 
@@ -86,9 +127,9 @@ class ExecutionOrchestrator:
         if not callback_result.success:
             return self.result
 
-        # Step 5: Process results
+        # Step 5: Process results (pass the in-memory dict, skip re-reading)
         result_step_result = self._execute_result_step(
-            callback_result.data['callback_file']
+            callback_result.data['callback_result']
         )
 
         self.result.success = result_step_result.success
@@ -110,10 +151,15 @@ class ExecutionOrchestrator:
 
         return result
 
-    def _execute_collection_step(self, repo_path: str) -> StepResult:
+    def _execute_collection_step(
+        self,
+        repo_path: str,
+        collection_step: Optional[CollectionStep] = None,
+        file_paths: Optional[list] = None
+    ) -> StepResult:
         """Execute collection step"""
-        collection_step = CollectionStep()
-        result = collection_step.execute(repo_path)
+        collection_step = collection_step or CollectionStep()
+        result = collection_step.execute(repo_path, file_paths=file_paths)
 
         if result.success:
             self.result.payload_file = result.data
@@ -125,7 +171,7 @@ class ExecutionOrchestrator:
 
     def _execute_processing_step(self, payload_file: str) -> StepResult:
         """Execute processing step"""
-        processing_step = ProcessingStep()
+        processing_step = ProcessingStep(api_client=self._get_api_client())
         result = processing_step.execute(payload_file)
 
         if result.success:
@@ -138,7 +184,7 @@ class ExecutionOrchestrator:
 
     def _execute_callback_step(self, execution_id: str) -> StepResult:
         """Execute callback step"""
-        callback_step = CallbackStep()
+        callback_step = CallbackStep(api_client=self._get_api_client())
         result = callback_step.execute(execution_id)
 
         if result.success:
@@ -149,10 +195,10 @@ class ExecutionOrchestrator:
 
         return result
 
-    def _execute_result_step(self, callback_file: str) -> StepResult:
+    def _execute_result_step(self, callback_source) -> StepResult:
         """Execute result processing step"""
         result_step = ResultStep()
-        result = result_step.execute(callback_file)
+        result = result_step.execute(callback_source)
 
         if result.success:
             self.result.results_directory = result.data['output_dir']
@@ -2,15 +2,27 @@
 Report generation for modernization results
 """
 import json
+from dataclasses import asdict
 from pathlib import Path
 from typing import List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from domain.entities import ModernizationResult
 
 
 class ReportGenerator:
     """Generate reports from modernization results"""
 
+    # Bulky or internal fields kept out of the report; has_changes and
+    # has_modernized_content summarize them instead
+    _EXCLUDED_FIELDS = frozenset(
+        {'original_content', 'modernized_content', 'content_changed'}
+    )
+
     def __init__(self, results: List[ModernizationResult]):
         self.results = results
 
@@ -21,9 +33,13 @@ class ReportGenerator:
             'results': self._generate_results_list()
         }
 
-        Path(output_path).write_text(
-            json.dumps(report, indent=2, ensure_ascii=False)
-        )
+        if orjson is not None:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+
+        # Single write syscall instead of many small buffered writes
+        Path(output_path).write_bytes(data)
 
         print(f"📄 Report saved: {output_path}")
 
@@ -46,10 +62,12 @@ class ReportGenerator:
         """Generate list of individual results"""
         return [
             {
-                'file_path': r.file_path,
-                'is_successful': r.is_successful,
-                'execution_id': r.execution_id,
-                'error_message': r.error_message,
+                **{
+                    key: value
+                    for key, value in asdict(r).items()
+                    if key not in self._EXCLUDED_FIELDS
+                },
+                'has_modernized_content': r.modernized_content is not None,
                 'has_changes': r.has_changes
             }
             for r in self.results
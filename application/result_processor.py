@@ -9,6 +9,14 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
+# Compiled once at import: these run for every step answer parsed
+_CODE_BLOCK_PATTERNS = [
+    re.compile(r'```json\s*\n(.*?)\n```', re.DOTALL),
+    re.compile(r'```\s*\n(.*?)\n```', re.DOTALL),
+    re.compile(r'```json(.*?)```', re.DOTALL),
+    re.compile(r'```(.*?)```', re.DOTALL)
+]
+
 
 @dataclass
 class AnalysisResult:
@@ -72,30 +80,39 @@ class StackSpotResultProcessor:
         self.refactor = None
         self.metrics = None
 
-    def load_callback_result(self, callback_file_path: str) -> Dict:
-        """Load callback result from JSON file"""
-        try:
-            with open(callback_file_path, 'r', encoding='utf-8') as f:
-                self.raw_result = json.load(f)
-
-            print(f"✅ Callback result loaded successfully")
-            print(f"📊 Execution ID: {self.raw_result.get('execution_id', 'N/A')}")
-            print(f"🎯 Command: {self.raw_result.get('quick_command_slug', 'N/A')}")
+    def load_callback_result(self, source) -> Dict:
+        """
+        Load callback result from a JSON file path or a pre-loaded dict
+
+        Accepting the dict directly lets callers that already hold the
+        callback in memory skip a disk round-trip (and a second resident
+        copy of a potentially large result).
+        """
+        if isinstance(source, dict):
+            self.raw_result = source
+            print(f"✅ Callback result received in memory")
+        else:
+            try:
+                with open(source, 'r', encoding='utf-8') as f:
+                    self.raw_result = json.load(f)
+                print(f"✅ Callback result loaded successfully")
+            except FileNotFoundError:
+                print(f"❌ File not found: {source}")
+                return {}
+            except json.JSONDecodeError as e:
+                print(f"❌ Invalid JSON in file: {e}")
+                return {}
+            except Exception as e:
+                print(f"❌ Error loading callback result: {e}")
+                return {}
+
+        print(f"📊 Execution ID: {self.raw_result.get('execution_id', 'N/A')}")
+        print(f"🎯 Command: {self.raw_result.get('quick_command_slug', 'N/A')}")
 
-            progress = self.raw_result.get('progress', {})
-            print(f"⏱️ Status: {progress.get('status', 'N/A')}")
-
-            return self.raw_result
+        progress = self.raw_result.get('progress', {})
+        print(f"⏱️ Status: {progress.get('status', 'N/A')}")
 
-        except FileNotFoundError:
-            print(f"❌ File not found: {callback_file_path}")
-            return {}
-        except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON in file: {e}")
-            return {}
-        except Exception as e:
-            print(f"❌ Error loading callback result: {e}")
-            return {}
+        return self.raw_result
 
     def extract_step_results(self) -> Dict[str, Any]:
         """Extract results from each step"""
@@ -152,15 +169,8 @@ class StackSpotResultProcessor:
         # Strategy 2: Extract from markdown code blocks
         try:
             # Match ```json ... ``` or ``` ... ```
-            patterns = [
-                r'```json\s*\n(.*?)\n```',
-                r'```\s*\n(.*?)\n```',
-                r'```json(.*?)```',
-                r'```(.*?)```'
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, answer, re.DOTALL)
+            for pattern in _CODE_BLOCK_PATTERNS:
+                match = pattern.search(answer)
                 if match:
                     json_str = match.group(1).strip()
                     return json.loads(json_str)
@@ -504,8 +514,10 @@ class StackSpotResultProcessor:
             if data:
                 file_path = output_path / f"{step_name}-result.json"
                 try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
+                    # Serialize in memory, flush with one write syscall
+                    file_path.write_bytes(
+                        json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+                    )
                     saved_files[step_name] = str(file_path)
                     print(f"✅ Saved {step_name} to {file_path}")
                 except Exception as e:
@@ -515,8 +527,7 @@ class StackSpotResultProcessor:
         try:
             summary_report = self.generate_summary_report()
             report_path = output_path / "modernization-report.md"
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(summary_report)
+            report_path.write_text(summary_report, encoding='utf-8')
             saved_files['report'] = str(report_path)
             print(f"✅ Saved report to {report_path}")
         except Exception as e:
@@ -4,7 +4,13 @@ Callback fetching step
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from domain.entities import StepResult
+from infrastructure.api_cache import ApiCache
 from infrastructure.stackspot_client import StackspotApiClient
 from config.settings import settings
 
@@ -12,9 +18,12 @@ from config.settings import settings
 class CallbackStep:
     """Handles callback result fetching"""
 
-    def __init__(self):
-        self.api_client = StackspotApiClient(str(settings.CREDENTIALS_PATH))
-        self.output_dir = settings.PROJECT_ROOT / "assets"
+    # Output directory is created at most once per process
+    _output_dir_ready = False
+
+    def __init__(self, api_client: StackspotApiClient = None):
+        self.api_client = api_client or StackspotApiClient(str(settings.CREDENTIALS_PATH))
+        self.cache = ApiCache()
 
     def execute(self, execution_id: str) -> StepResult:
         """
@@ -29,8 +38,18 @@ class CallbackStep:
         print("\n" + "📞 STEP 4: Fetching Callback Result".center(60, "="))
 
         try:
-            # Get callback result
-            callback_result = self.api_client.get_callback_result(execution_id)
+            # Completed callbacks never change, so serve repeats from disk
+            callback_result = self.cache.get(execution_id)
+            if callback_result:
+                print(f"⚡ Using cached callback result")
+            else:
+                callback_result = self.api_client.get_callback_result(execution_id)
+                if self._is_complete(callback_result):
+                    self.cache.set(
+                        execution_id,
+                        callback_result,
+                        expire=settings.CALLBACK_CACHE_TTL
+                    )
 
             if not callback_result:
                 return StepResult(
@@ -38,19 +57,17 @@ class CallbackStep:
                     error='Callback result not available'
                 )
 
-            # Save callback results
-            callback_file, pretty_file = self._save_callback_results(callback_result)
+            # Save callback result
+            callback_file = self._save_callback_results(callback_result)
 
             return StepResult(
                 success=True,
                 data={
                     'callback_result': callback_result,
-                    'callback_file': str(callback_file),
-                    'pretty_file': str(pretty_file)
+                    'callback_file': str(callback_file)
                 },
                 metadata={
-                    'callback_file': str(callback_file),
-                    'pretty_file': str(pretty_file)
+                    'callback_file': str(callback_file)
                 }
             )
 
@@ -59,20 +76,34 @@ class CallbackStep:
             print(f"❌ {error_msg}")
             return StepResult(success=False, error=error_msg)
 
-    def _save_callback_results(self, callback_result: dict) -> tuple[Path, Path]:
-        """Save callback results to files"""
-        self.output_dir.mkdir(exist_ok=True)
-
-        # Save compact version
-        callback_file = self.output_dir / "callback-result.json"
-        with open(callback_file, 'w', encoding='utf-8') as f:
-            json.dump(callback_result, f, indent=2, ensure_ascii=False)
+    @staticmethod
+    def _is_complete(callback_result: dict) -> bool:
+        """Check whether a callback result reached a final state"""
+        if not callback_result:
+            return False
+        status = callback_result.get('progress', {}).get('status')
+        return status in ('COMPLETED', 'FAILURE')
+
+    def _save_callback_results(self, callback_result: dict) -> Path:
+        """Save the callback result to a single pretty-printed file"""
+        if not CallbackStep._output_dir_ready:
+            settings.ASSETS_DIR.mkdir(exist_ok=True)
+            CallbackStep._output_dir_ready = True
+
+        callback_file = settings.CALLBACK_RESULT_FILE
+        callback_file.write_bytes(self._serialize(callback_result, pretty=True))
         print(f"💾 Callback result saved to: {callback_file}")
 
-        # Save pretty version
-        pretty_file = self.output_dir / "callback-result-pretty.json"
-        with open(pretty_file, 'w', encoding='utf-8') as f:
-            json.dump(callback_result, f, indent=4, ensure_ascii=False)
-        print(f"📄 Pretty version saved to: {pretty_file}")
+        return callback_file
+
+    @staticmethod
+    def _serialize(callback_result: dict, pretty: bool = False) -> bytes:
+        """Serialize a callback result, preferring orjson when available"""
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(callback_result, option=option)
 
-        return callback_file, pretty_file
\ No newline at end of file
+        indent = 2 if pretty else None
+        return json.dumps(
+            callback_result, indent=indent, ensure_ascii=False
+        ).encode('utf-8')
\ No newline at end of file
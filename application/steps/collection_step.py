@@ -1,6 +1,8 @@
 """
 File collection step
 """
+from typing import List, Optional
+
 from domain.entities import StepResult
 from infrastructure.file_collector import FileCollectorService
 from config.settings import settings
@@ -12,12 +14,31 @@ class CollectionStep:
     def __init__(self):
         self.file_collector = FileCollectorService()
 
-    def execute(self, cloned_repo_path: str) -> StepResult:
+    def prefetch_paths(self) -> Optional[List[str]]:
+        """
+        Parse the paths file ahead of time (e.g. while git is cloning)
+
+        Returns None on failure so the error surfaces in execute() with
+        the usual step reporting.
+        """
+        try:
+            return self.file_collector.read_paths_file(
+                str(settings.MAIN_PATHS_FILE)
+            )
+        except Exception:
+            return None
+
+    def execute(
+        self,
+        cloned_repo_path: str,
+        file_paths: Optional[List[str]] = None
+    ) -> StepResult:
         """
         Execute file collection
 
         Args:
             cloned_repo_path: Path to cloned repository
+            file_paths: Pre-parsed path list from prefetch_paths, if any
 
         Returns:
             StepResult with payload file path
@@ -28,7 +49,8 @@ class CollectionStep:
             payload_file = self.file_collector.generate_payload_file(
                 cloned_repo_path=cloned_repo_path,
                 paths_file_path=str(settings.MAIN_PATHS_FILE),
-                output_file_path=str(settings.MAIN_PAYLOAD_FILE)
+                output_file_path=str(settings.MAIN_PAYLOAD_FILE),
+                file_paths=file_paths
             )
 
             return StepResult(
@@ -1,7 +1,8 @@
 """
 Result processing step
 """
-from application.result_processor import StackSpotResultProcessor
+import traceback
+
 from config.settings import settings
 from domain.entities import StepResult
 
@@ -10,15 +11,19 @@ class ResultStep:
     """Handles result processing and report generation"""
 
     def __init__(self):
+        # Imported lazily: the processor module (500+ lines of parsing and
+        # report generation) only loads when step 5 actually runs
+        from application.result_processor import StackSpotResultProcessor
+
         self.processor = StackSpotResultProcessor()
-        self.output_dir = settings.PROJECT_ROOT / "assets" / "results"
+        self.output_dir = settings.RESULTS_OUTPUT_DIR
 
-    def execute(self, callback_file: str) -> StepResult:
+    def execute(self, callback_source) -> StepResult:
         """
         Execute result processing
 
         Args:
-            callback_file: Path to callback result JSON file
+            callback_source: Callback result dict, or path to its JSON file
 
         Returns:
             StepResult with processed results
@@ -27,7 +32,7 @@ class ResultStep:
 
         try:
             # Load callback result
-            callback_data = self.processor.load_callback_result(callback_file)
+            callback_data = self.processor.load_callback_result(callback_source)
             if not callback_data:
                 return StepResult(
                     success=False,
@@ -61,7 +66,6 @@ class ResultStep:
         except Exception as e:
             error_msg = f"Failed to process results: {e}"
             print(f"❌ {error_msg}")
-            import traceback
             traceback.print_exc()
             return StepResult(success=False, error=error_msg)
 
@@ -21,17 +21,21 @@ class SetupValidator:
         Returns:
             True if validation passes, False otherwise
         """
-        self._validate_credentials()
+        # Stat the credentials file once and reuse the answer below
+        credentials_exist = settings.CREDENTIALS_PATH.exists()
+
+        self._validate_credentials(credentials_exist)
 
         if not self.dev_mode:
-            self._validate_git_token()
+            if credentials_exist:
+                self._validate_git_token()
             self._validate_paths_file()
 
         return len(self.errors) == 0
 
-    def _validate_credentials(self) -> None:
+    def _validate_credentials(self, credentials_exist: bool) -> None:
         """Validate credentials file exists"""
-        if not settings.CREDENTIALS_PATH.exists():
+        if not credentials_exist:
             self.errors.append(
                 f"❌ Credentials file not found: {settings.CREDENTIALS_PATH}\n"
                 f"   Create it from: {settings.PROJECT_ROOT / 'secrets-example.json'}"
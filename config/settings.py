@@ -2,9 +2,18 @@
 """
 Application settings and configuration
 """
+from functools import lru_cache
 from pathlib import Path
 import json
 
+
+@lru_cache(maxsize=None)
+def _parse_credentials(path_str: str, mtime: float) -> dict:
+    """Parse credentials once per (path, mtime); re-parses only on edits"""
+    with open(path_str, 'r') as f:
+        return json.load(f)
+
+
 class Settings:
     """Application settings"""
 
@@ -15,7 +24,18 @@ class Settings:
 
     # StackSpot
     QUICK_COMMAND_SLUG = 'modernize-legacy-java-code'
-    POLLING_DELAY = 23
+    # Polling paces itself with exponential backoff + jitter between these
+    # bounds instead of a fixed delay, so fast jobs finish in seconds
+    POLLING_BASE_DELAY = 1.0
+    POLLING_MAX_DELAY = 30.0
+    MAX_PARALLEL = 16
+    # Client-side pacing: sustained requests per second across all threads
+    RATE_LIMIT_QPS = 8.0
+
+    # API response cache
+    API_CACHE_DIR = PROJECT_ROOT / '.cache' / 'stackspot'
+    QUICK_COMMAND_CACHE_TTL = 3600       # seconds
+    CALLBACK_CACHE_TTL = 86400           # callbacks are immutable once complete
 
     # Git Repository Configuration (FIXED VALUES)
     GIT_REPO_URL = "https://github.com/gomesmr/desafio-hackathon-zup-byte-t3"
@@ -25,8 +45,13 @@ class Settings:
     CLONE_ACTION_PATH = r"C:\Users\marcelo.gomes\gomesmr\Hackathon\clone-repository-action"
 
     # File Collection Paths - NOVOS CAMINHOS
-    MAIN_PATHS_FILE = PROJECT_ROOT / "assets" / "main-paths.txt"
-    MAIN_PAYLOAD_FILE = PROJECT_ROOT / "assets" / "main-payload.md"
+    ASSETS_DIR = PROJECT_ROOT / "assets"
+    MAIN_PATHS_FILE = ASSETS_DIR / "main-paths.txt"
+    MAIN_PAYLOAD_FILE = ASSETS_DIR / "main-payload.md"
+
+    # Output Paths (computed once at import)
+    CALLBACK_RESULT_FILE = ASSETS_DIR / "callback-result.json"
+    RESULTS_OUTPUT_DIR = ASSETS_DIR / "results"
 
     # File System
     IGNORED_DIRECTORIES = {
@@ -42,11 +67,14 @@ class Settings:
                 f"Create it from: {self.PROJECT_ROOT / 'secrets-example.json'}"
             )
 
-        with open(self.CREDENTIALS_PATH, 'r') as f:
-            return json.load(f)
+        return _parse_credentials(
+            str(self.CREDENTIALS_PATH),
+            self.CREDENTIALS_PATH.stat().st_mtime
+        )
 
+    @lru_cache(maxsize=1)
     def get_git_token(self) -> str:
-        """Get Git token from credentials"""
+        """Get Git token from credentials (parsed once per process)"""
         creds = self.load_credentials()
         return creds.get('git_token', '')
 
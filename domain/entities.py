@@ -7,11 +7,15 @@ from typing import Optional
 
 @dataclass(frozen=True)
 class JavaFile:
-    """Represents a Java source file"""
+    """Represents a Java source file
+
+    content may be None for files whose text has been released after
+    submission; consumers re-read it from disk when needed.
+    """
     absolute_path: str
     relative_path: str
     filename: str
-    content: str
+    content: Optional[str]
     size_in_bytes: int
 
     @property
@@ -20,25 +24,39 @@ class JavaFile:
         return bool(self.content and self.content.strip())
 
 
-@dataclass
+@dataclass(slots=True)
 class ModernizationResult:
-    """Result of a file modernization operation"""
+    """Result of a file modernization operation
+
+    slots=True drops the per-instance __dict__; one result is kept per
+    file for the whole run, so the overhead is paid thousands of times.
+    """
     file_path: str
     is_successful: bool
     execution_id: Optional[str] = None
     error_message: Optional[str] = None
     original_content: Optional[str] = None
     modernized_content: Optional[str] = None
+    # Set by release_contents() so has_changes survives freeing the text
+    content_changed: Optional[bool] = None
 
     @property
     def has_changes(self) -> bool:
         """Check if modernization produced changes"""
+        if self.content_changed is not None:
+            return self.content_changed
         return (
             self.is_successful and
             self.modernized_content is not None and
             self.original_content != self.modernized_content
         )
 
+    def release_contents(self) -> None:
+        """Free both content strings once persisted, keeping has_changes"""
+        self.content_changed = self.has_changes
+        self.original_content = None
+        self.modernized_content = None
+
 """
 Execution result models
 """
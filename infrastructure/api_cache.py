@@ -0,0 +1,63 @@
+# infrastructure/api_cache.py
+"""
+Persistent on-disk cache for StackSpot API responses
+"""
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from config.settings import settings
+
+
+class ApiCache:
+    """JSON-file cache keyed by opaque strings, with per-entry TTL"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else settings.API_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def payload_key(command_slug: str, payload_content: str) -> str:
+        """Build a cache key from a quick command slug and its payload"""
+        digest = hashlib.sha256()
+        digest.update(command_slug.encode('utf-8'))
+        digest.update(payload_content.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired"""
+        path = self._entry_path(key)
+
+        try:
+            entry = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        expires_at = entry.get('expires_at')
+        if expires_at is not None and time.time() > expires_at:
+            path.unlink(missing_ok=True)
+            return None
+
+        return entry.get('value')
+
+    def set(self, key: str, value: Any, expire: Optional[int] = None) -> None:
+        """Cache a value, optionally expiring after `expire` seconds"""
+        entry = {
+            'expires_at': time.time() + expire if expire else None,
+            'value': value
+        }
+
+        try:
+            self._entry_path(key).write_text(
+                json.dumps(entry, ensure_ascii=False),
+                encoding='utf-8'
+            )
+        except OSError:
+            # Caching is best-effort; never fail the pipeline over it
+            pass
+
+    def _entry_path(self, key: str) -> Path:
+        """Map a cache key to its file on disk"""
+        return self.cache_dir / f"{key}.json"
@@ -1,13 +1,20 @@
 """
 File collector service for generating payload files
 """
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import chardet
 
 from domain.exceptions import FileProcessingError
 
+logger = logging.getLogger(__name__)
+
+# Banner precomputed once instead of rebuilt per run
+_SEPARATOR = '=' * 60
+
 
 class FileCollectorService:
     """Service for collecting files and generating consolidated payloads"""
@@ -16,7 +23,8 @@ class FileCollectorService:
             self,
             cloned_repo_path: str,
             paths_file_path: str,
-            output_file_path: str
+            output_file_path: str,
+            file_paths: Optional[List[str]] = None
     ) -> str:
         """
         Gera um arquivo consolidado com o conteúdo dos arquivos listados
@@ -25,34 +33,40 @@ class FileCollectorService:
             cloned_repo_path: Caminho do repositório clonado
             paths_file_path: Arquivo com lista de caminhos
             output_file_path: Arquivo de saída consolidado
+            file_paths: Lista de caminhos já carregada (opcional); quando
+                fornecida, a leitura do arquivo de caminhos é pulada
 
         Returns:
             Caminho do arquivo gerado
         """
         try:
-            print(f"\n{'=' * 60}")
-            print(f"📄 Generating Payload File")
-            print(f"{'=' * 60}")
-            print(f"📁 Source repo: {cloned_repo_path}")
-            print(f"📋 Paths file: {paths_file_path}")
-            print(f"📄 Output file: {output_file_path}")
-
-            # 1. Lê a lista de arquivos
-            file_paths = self._read_paths_file(paths_file_path)
-            print(f"📊 Found {len(file_paths)} files to collect")
-
-            # 2. Coleta cada arquivo
+            logger.info("\n%s\n📄 Generating Payload File\n%s", _SEPARATOR, _SEPARATOR)
+            logger.info("📁 Source repo: %s", cloned_repo_path)
+            logger.info("📋 Paths file: %s", paths_file_path)
+            logger.info("📄 Output file: %s", output_file_path)
+
+            # 1. Lê a lista de arquivos (se não veio pré-carregada)
+            if file_paths is None:
+                file_paths = self._read_paths_file(paths_file_path)
+            logger.info("📊 Found %s files to collect", len(file_paths))
+
+            # 2. Lê os arquivos em paralelo (I/O bound), montando em ordem
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                contents = list(executor.map(
+                    lambda relative_path: self._collect_file(
+                        cloned_repo_path, relative_path
+                    ),
+                    file_paths
+                ))
+
             payload_content = ["# Código do Repositório para Modernização\n\n"]
 
             collected_count = 0
             missing_count = 0
 
-            for relative_path in file_paths:
-                full_path = os.path.join(cloned_repo_path, relative_path)
-
-                if os.path.exists(full_path):
-                    content = self._read_file_as_utf8_safe(full_path)
-                    extension = Path(full_path).suffix.lower()
+            for relative_path, content in zip(file_paths, contents):
+                if content is not None:
+                    extension = Path(relative_path).suffix.lower()
                     language = self._get_language_from_extension(extension)
 
                     payload_content.extend([
@@ -62,13 +76,13 @@ class FileCollectorService:
                         "\n```\n\n"
                     ])
                     collected_count += 1
-                    print(f"✅ Collected: {relative_path}")
+                    logger.info("✅ Collected: %s", relative_path)
                 else:
                     payload_content.extend([
                         f"## ❌ {relative_path} (arquivo não encontrado)\n\n"
                     ])
                     missing_count += 1
-                    print(f"⚠️  Missing: {relative_path}")
+                    logger.info("⚠️  Missing: %s", relative_path)
 
             # 3. Salva o arquivo consolidado
             os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
@@ -76,22 +90,44 @@ class FileCollectorService:
             with open(output_file_path, 'w', encoding='utf-8') as f:
                 f.writelines(payload_content)
 
-            print(f"\n📊 Collection Summary:")
-            print(f"   ✅ Collected: {collected_count}")
-            print(f"   ⚠️  Missing: {missing_count}")
-            print(f"   📄 Output: {output_file_path}")
+            logger.info(
+                "\n📊 Collection Summary:\n   ✅ Collected: %s\n"
+                "   ⚠️  Missing: %s\n   📄 Output: %s",
+                collected_count, missing_count, output_file_path
+            )
 
             return output_file_path
 
         except Exception as e:
             raise FileProcessingError(f"Erro ao gerar arquivo payload: {str(e)}")
 
+    def read_paths_file(self, paths_file_path: str) -> List[str]:
+        """Lê a lista de caminhos (público para permitir pré-carga)"""
+        return self._read_paths_file(paths_file_path)
+
+    def _collect_file(
+            self,
+            cloned_repo_path: str,
+            relative_path: str
+    ) -> Optional[str]:
+        """Lê um arquivo do repositório; retorna None se não existir"""
+        full_path = os.path.join(cloned_repo_path, relative_path)
+
+        if not os.path.exists(full_path):
+            return None
+
+        return self._read_file_as_utf8_safe(full_path)
+
     def _read_paths_file(self, paths_file_path: str) -> List[str]:
         """Lê arquivo com lista de caminhos"""
         try:
-            with open(paths_file_path, 'r', encoding='utf-8') as f:
-                paths = [line.strip() for line in f.readlines() if line.strip()]
-            return paths
+            # Uma leitura bruta + decode, sem passar pelo TextIOWrapper
+            raw = Path(paths_file_path).read_bytes()
+            return [
+                line.strip()
+                for line in raw.decode('utf-8').splitlines()
+                if line.strip()
+            ]
         except Exception as e:
             raise FileProcessingError(f"Erro ao ler arquivo de caminhos: {str(e)}")
 
@@ -99,20 +135,17 @@ class FileCollectorService:
         """Lê arquivo garantindo UTF-8 seguro"""
         try:
             # Detecta a codificação do arquivo
-            with open(file_path, 'rb') as f:
-                raw_data = f.read()
+            raw_data = Path(file_path).read_bytes()
 
             result = chardet.detect(raw_data)
             encoding = result['encoding'] or 'utf-8'
 
-            # Lê com a codificação detectada
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
+            # Decodifica os bytes já lidos, sem reabrir o arquivo
+            return raw_data.decode(encoding)
         except Exception:
             # Fallback para latin-1 se tudo falhar
             try:
-                with open(file_path, 'r', encoding='latin-1') as f:
-                    return f.read()
+                return Path(file_path).read_bytes().decode('latin-1')
             except Exception as e:
                 return f"# Erro ao ler arquivo: {str(e)}\n"
 
@@ -1,6 +1,7 @@
 """
 File system operations for Java files
 """
+import logging
 import os
 from typing import List, Generator
 from pathlib import Path
@@ -8,6 +9,8 @@ from pathlib import Path
 from domain.entities import JavaFile
 from domain.exceptions import InvalidDirectoryError, FileProcessingError
 
+logger = logging.getLogger(__name__)
+
 
 class JavaFileRepository:
     """Repository for finding and reading Java files"""
@@ -24,6 +27,7 @@ class JavaFileRepository:
     ):
         self.root_path = Path(root_directory).resolve()
         self.ignored_directories = ignored_directories or self.DEFAULT_IGNORED_DIRECTORIES
+        self._java_files: List[Path] = None
 
         self._validate_directory()
 
@@ -40,21 +44,30 @@ class JavaFileRepository:
             )
 
     def find_all_java_files(self) -> List[Path]:
-        """Find all .java files in directory tree"""
-        java_files = []
+        """Find all .java files in directory tree (walked once, then cached)"""
+        if self._java_files is not None:
+            return self._java_files
 
-        for root, dirs, files in os.walk(self.root_path):
-            # Remove ignored directories from search
-            dirs[:] = [
-                d for d in dirs
-                if d not in self.ignored_directories
-            ]
+        java_files = []
+        stack = [str(self.root_path)]
 
-            # Add .java files
-            for file in files:
-                if file.endswith('.java'):
-                    java_files.append(Path(root) / file)
+        # Manual os.scandir recursion: DirEntry exposes the file type from
+        # the directory read itself, so no per-entry stat() is needed and
+        # ignored directories are pruned before ever being opened
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.ignored_directories:
+                                stack.append(entry.path)
+                        elif entry.name.endswith('.java'):
+                            java_files.append(Path(entry.path))
+            except OSError:
+                continue
 
+        self._java_files = java_files
         return java_files
 
     def read_java_file(self, file_path: Path) -> JavaFile:
@@ -87,14 +100,23 @@ class JavaFileRepository:
             try:
                 yield self.read_java_file(file_path)
             except FileProcessingError as e:
-                print(f"⚠️ Warning: {e}")
+                logger.warning("⚠️ Warning: %s", e)
                 continue
 
     def save_file(self, file_path: str, content: str) -> None:
-        """Save content to file"""
+        """Save content to file atomically"""
+        tmp_path = f"{file_path}.tmp"
         try:
-            Path(file_path).write_text(content, encoding='utf-8')
+            # Pre-encode and emit the whole file in one write() call,
+            # then rename into place: a crash mid-write leaves the
+            # original intact instead of a truncated file
+            Path(tmp_path).write_bytes(content.encode('utf-8'))
+            os.replace(tmp_path, file_path)
         except Exception as e:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
             raise FileProcessingError(
                 f"Failed to save file {file_path}: {e}"
             )
@@ -0,0 +1,42 @@
+"""
+Client-side rate limiting
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket for pacing outbound API calls
+
+    The client knows its own rate limit, so paying a short wait up front
+    is cheaper than discovering 429s and retrying after the fact. Tokens
+    refill continuously at rate_per_sec up to capacity, so short bursts
+    are allowed while the sustained rate stays within the limit.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float = None):
+        self.rate = float(rate_per_sec)
+        self.capacity = float(capacity) if capacity is not None else self.rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until the requested number of tokens is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait_time = (tokens - self._tokens) / self.rate
+
+            # Sleep outside the lock so other threads can refill/acquire
+            time.sleep(wait_time)
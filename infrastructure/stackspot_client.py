@@ -3,21 +3,122 @@
 Client for Stackspot AI API
 """
 import json
+import logging
+import random
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import threading
+import time
+import weakref
 import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Generator, Iterable, Optional, Callable, Tuple
 
+from config.settings import settings
 from domain.exceptions import CredentialsNotFoundError, StackspotApiError
+from infrastructure.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _read_credentials(path_str: str, mtime: float) -> dict:
+    """Parse the credentials file once per (path, mtime) pair
+
+    Keyed on mtime so the cache invalidates itself whenever the file is
+    edited, while repeated client constructions skip the read and parse.
+    """
+    data = Path(path_str).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class StackspotApiClient:
     """Client for interacting with Stackspot AI API"""
 
+    CALLBACK_BASE = "https://genai-code-buddy-api.stackspot.com/v1/quick-commands/callback/"
+    AUTH_URL = "https://idm.stackspot.com/zup/oidc/oauth/token"
+
+    # Assumed token lifetime when the issuer does not report expires_in
+    DEFAULT_TOKEN_TTL = 300
+
+    # Keys the API may use for the generated code, in preference order
+    _RESULT_KEYS = ('codigo_java', 'code', 'content')
+
+    # Live instances, so a signal handler can cancel them all at once
+    _instances = weakref.WeakSet()
+
     def __init__(self, credentials_path: str):
         self.credentials = self._load_credentials(credentials_path)
         self.client = None
         self.access_token = None
+        self._token_expires_at = 0.0
+        self._cancel = threading.Event()
+        # Per-execution (etag, body) pairs for conditional callback GETs
+        self._callback_cache = {}
+        # Shared across all worker threads so the aggregate request rate
+        # stays under the StackSpot limit regardless of fan-out
+        self._rate_limiter = TokenBucket(settings.RATE_LIMIT_QPS)
+        self.session = self._create_session()
         self._initialize_client()
+        StackspotApiClient._instances.add(self)
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a pooled session with keep-alive and retries
+
+        The pool is sized so every concurrent polling worker keeps its own
+        warm connection: no TCP+TLS handshake (~2 RTTs) is paid once the
+        pool is populated, even with gather_results running at full fan-out.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max(32, settings.MAX_PARALLEL * 2),
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def cancel(self) -> None:
+        """Request cancellation of any in-flight polling"""
+        self._cancel.set()
+
+    @classmethod
+    def cancel_all(cls) -> None:
+        """Cancel polling on every live client instance"""
+        for instance in cls._instances:
+            instance.cancel()
+
+    def close(self) -> None:
+        """Release the pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    @staticmethod
+    def _backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+        """Exponential backoff capped at max_delay, with jitter"""
+        delay = min(max_delay, base_delay * (2 ** attempt))
+        return delay + random.uniform(0, 0.5 * base_delay)
+
+    def _wait(self, delay: float) -> None:
+        """Sleep between polls, waking immediately on cancellation"""
+        if self._cancel.wait(delay):
+            raise StackspotApiError("Polling cancelled")
 
     def _load_credentials(self, credentials_path: str) -> dict:
         """Load credentials from JSON file"""
@@ -29,8 +130,9 @@ class StackspotApiClient:
             )
 
         try:
-            return json.loads(path.read_text())
-        except json.JSONDecodeError as e:
+            return _read_credentials(str(path), path.stat().st_mtime)
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
             raise CredentialsNotFoundError(
                 f"Invalid JSON in credentials file: {e}"
             )
@@ -42,37 +144,52 @@ class StackspotApiClient:
             self.client = Stackspot(self.credentials)
             # Obter token de acesso para chamadas diretas à API
             self._get_access_token()
-            print(f"✅ StackSpot client initialized successfully")
+            logger.info("✅ StackSpot client initialized successfully")
         except ImportError:
-            print("⚠️ Stackspot SDK not installed, using direct API calls only")
+            logger.warning("⚠️ Stackspot SDK not installed, using direct API calls only")
             self.client = None
         except Exception as e:
-            print(f"⚠️ Failed to initialize Stackspot client: {e}")
+            logger.warning("⚠️ Failed to initialize Stackspot client: %s", e)
             self.client = None
 
     def _get_access_token(self):
         """Get access token for direct API calls"""
         if not self.client:
-            print("⚠️ No StackSpot client available for token generation")
+            logger.warning("⚠️ No StackSpot client available for token generation")
             return
 
         try:
             # Usar o SDK para obter o token
             self.access_token = self.client.get_access_token()
-            print(f"✅ Access token obtained")
+            # The SDK does not expose expires_in, so assume a short TTL
+            self._token_expires_at = time.monotonic() + self.DEFAULT_TOKEN_TTL
+            logger.info("✅ Access token obtained")
         except Exception as e:
-            print(f"⚠️ Could not get access token: {e}")
+            logger.warning("⚠️ Could not get access token: %s", e)
             self.access_token = None
 
     def execute_quick_command(
             self,
             command_slug: str,
-            input_content: str
+            input_content
     ) -> str:
-        """Execute a quick command and return execution ID"""
+        """
+        Execute a quick command and return execution ID
+
+        Accepts the payload as a string or as an open file-like object;
+        file-likes are read only here, just before submission, so large
+        payloads are not held in memory any longer than the SDK requires.
+        """
         if not self.client:
             raise StackspotApiError("StackSpot client not available")
 
+        if hasattr(input_content, 'read'):
+            input_content = input_content.read()
+        if isinstance(input_content, bytes):
+            input_content = input_content.decode('utf-8')
+
+        self._rate_limiter.acquire()
+
         try:
             execution_id = self.client.ai.quick_command.create_execution(
                 command_slug,
@@ -87,16 +204,165 @@ class StackspotApiClient:
     def poll_execution_result(
             self,
             execution_id: str,
-            polling_delay: int = 23,
-            status_callback: Optional[Callable] = None
+            base_delay: float = settings.POLLING_BASE_DELAY,
+            max_delay: float = settings.POLLING_MAX_DELAY,
+            status_callback: Optional[Callable] = None,
+            timeout: int = 600
+    ) -> Optional[str]:
+        """Poll for execution result with exponential backoff and jitter"""
+        logger.info("   🔗 Execution ID: %s", execution_id)
+
+        self._ensure_access_token()
+        if not self.access_token:
+            # No token for direct API calls; let the SDK do the polling
+            return self._poll_via_sdk(execution_id, int(max_delay), status_callback)
+
+        url = self.CALLBACK_BASE + execution_id
+        callback = status_callback or self._default_callback
+        etag = None
+        attempt = 0
+        deadline = time.monotonic() + timeout
+
+        try:
+            while time.monotonic() < deadline:
+                headers = {
+                    'Authorization': f'Bearer {self.access_token}',
+                    'User-Agent': 'modern-jazz/1.0.0',
+                    'Accept': 'application/json'
+                }
+                if etag:
+                    # Conditional GET: the server answers 304 with no body
+                    # when the execution has not advanced since last poll
+                    headers['If-None-Match'] = etag
+
+                self._rate_limiter.acquire()
+                response = self.session.get(url, headers=headers, timeout=30)
+
+                if response.status_code == 304:
+                    self._wait(self._backoff_delay(attempt, base_delay, max_delay))
+                    attempt += 1
+                    continue
+
+                if response.status_code == 200:
+                    etag = response.headers.get('ETag')
+                    execution = response.json()
+                    callback(execution)
+
+                    status = execution.get('progress', {}).get('status')
+                    if status in ('COMPLETED', 'FAILURE'):
+                        return self._extract_result(execution)
+                else:
+                    logger.warning("⚠️ Poll returned status %s", response.status_code)
+
+                self._wait(self._backoff_delay(attempt, base_delay, max_delay))
+                attempt += 1
+
+            raise StackspotApiError(
+                f"Polling timed out after {timeout}s for execution: {execution_id}"
+            )
+
+        except StackspotApiError:
+            raise
+        except Exception as e:
+            raise StackspotApiError(
+                f"Failed to poll execution result: {e}"
+            )
+
+    def poll_many(
+            self,
+            execution_ids: Iterable[str],
+            max_workers: int = 16
+    ) -> list:
+        """
+        Poll many executions in parallel, preserving input order
+
+        Each worker thread spends most of its time sleeping or blocked on
+        socket I/O, so overlapping the waits scales well despite the GIL.
+
+        Args:
+            execution_ids: Execution IDs to poll
+            max_workers: Maximum number of concurrent polling threads
+
+        Returns:
+            List of results in the same order as execution_ids
+        """
+        execution_ids = list(execution_ids)
+        if not execution_ids:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(execution_ids))) as executor:
+            return list(executor.map(self.poll_execution_result, execution_ids))
+
+    def gather_results(
+            self,
+            execution_ids: Iterable[str],
+            timeout: int = 600,
+            max_workers: int = 16
+    ) -> Generator[Tuple[str, Optional[str]], None, None]:
+        """
+        Poll many executions concurrently, yielding results in completion order
+
+        Args:
+            execution_ids: Execution IDs to poll
+            timeout: Global timeout in seconds for the whole batch
+            max_workers: Maximum number of concurrent polling threads
+
+        Yields:
+            (execution_id, result) tuples as each execution completes;
+            result is None for executions that failed
+
+        Raises:
+            StackspotApiError: If the global timeout expires
+        """
+        execution_ids = list(execution_ids)
+        if not execution_ids:
+            return
+
+        deadline = time.monotonic() + timeout
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(execution_ids))) as executor:
+            futures = {
+                executor.submit(self.poll_execution_result, execution_id, timeout=timeout): execution_id
+                for execution_id in execution_ids
+            }
+            pending = set(futures)
+
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=deadline - time.monotonic(),
+                    return_when=FIRST_COMPLETED
+                )
+
+                if not done:
+                    # Global timeout: cancel whatever has not started yet
+                    # so sockets are freed immediately
+                    for future in pending:
+                        future.cancel()
+                    raise StackspotApiError(
+                        f"Timed out after {timeout}s waiting for "
+                        f"{len(pending)} pending execution(s)"
+                    )
+
+                for future in done:
+                    execution_id = futures[future]
+                    try:
+                        yield execution_id, future.result()
+                    except StackspotApiError as e:
+                        logger.warning("⚠️ Execution %s failed: %s", execution_id, e)
+                        yield execution_id, None
+
+    def _poll_via_sdk(
+            self,
+            execution_id: str,
+            polling_delay: int,
+            status_callback: Optional[Callable]
     ) -> Optional[str]:
-        """Poll for execution result"""
+        """Poll for execution result through the Stackspot SDK"""
         if not self.client:
             raise StackspotApiError("StackSpot client not available")
 
         try:
-            print(f"   🔗 Execution ID: {execution_id}")
-
             config = {
                 'delay': polling_delay,
                 'on_callback_response': status_callback or self._default_callback
@@ -124,28 +390,15 @@ class StackspotApiClient:
         Returns:
             Dictionary with the callback result or None if not available
         """
-        # Tentar obter token se não tiver
-        if not self.access_token and self.client:
-            self._get_access_token()
-
+        self._ensure_access_token()
         if not self.access_token:
-            print("⚠️ No access token available for callback API")
-            print("💡 Trying to get token using credentials directly...")
-
-            # Fallback: tentar obter token diretamente
-            token = self._get_token_direct()
-            if token:
-                self.access_token = token
-            else:
-                return None
+            return None
 
         try:
-            print(f"\n{'=' * 60}")
-            print(f"📞 Fetching Callback Result")
-            print(f"{'=' * 60}")
-            print(f"🔗 Execution ID: {execution_id}")
+            logger.info("📞 Fetching Callback Result")
+            logger.info("🔗 Execution ID: %s", execution_id)
 
-            url = f"https://genai-code-buddy-api.stackspot.com/v1/quick-commands/callback/{execution_id}"
+            url = self.CALLBACK_BASE + execution_id
 
             headers = {
                 'Authorization': f'Bearer {self.access_token}',
@@ -153,66 +406,105 @@ class StackspotApiClient:
                 'Accept': 'application/json'
             }
 
-            print(f"🌐 URL: {url}")
+            cached = self._callback_cache.get(execution_id)
+            if cached:
+                # Conditional GET: a 304 means the stored body is current
+                # and no bytes cross the wire
+                headers['If-None-Match'] = cached[0]
+
+            logger.debug("🌐 URL: %s", url)
 
-            response = requests.get(url, headers=headers, timeout=30)
+            self._rate_limiter.acquire()
+            response = self.session.get(url, headers=headers, timeout=30)
 
-            print(f"📊 Status Code: {response.status_code}")
+            logger.debug("📊 Status Code: %s", response.status_code)
+
+            if response.status_code == 304 and cached:
+                logger.info("⚡ Callback unchanged (304), reusing cached body")
+                return cached[1]
 
             if response.status_code == 200:
                 result = response.json()
-                print(f"✅ Callback result retrieved successfully")
-                print(f"📝 Result keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._callback_cache[execution_id] = (etag, result)
+                logger.info("✅ Callback result retrieved successfully")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "📝 Result keys: %s",
+                        list(result.keys()) if isinstance(result, dict) else 'Not a dict'
+                    )
                 return result
             elif response.status_code == 404:
-                print(f"⚠️ Callback not found (404) - may not be ready yet")
+                logger.warning("⚠️ Callback not found (404) - may not be ready yet")
                 return None
             else:
-                print(f"❌ API Error: {response.status_code}")
-                print(f"📄 Response: {response.text}")
+                logger.error("❌ API Error: %s", response.status_code)
+                logger.error("📄 Response: %s", response.text)
                 return None
 
         except requests.exceptions.Timeout:
-            print(f"⏰ Timeout while fetching callback")
+            logger.error("⏰ Timeout while fetching callback")
             return None
         except requests.exceptions.RequestException as e:
-            print(f"🌐 Network error: {e}")
+            logger.error("🌐 Network error: %s", e)
             return None
         except Exception as e:
-            print(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: %s", e)
             return None
 
+    def _ensure_access_token(self) -> None:
+        """Ensure a non-expired access token is available for direct API calls"""
+        # Token em cache ainda válido: nada a fazer
+        if self.access_token and time.monotonic() < self._token_expires_at:
+            return
+
+        # Tentar obter (ou renovar) token via SDK
+        self.access_token = None
+        if self.client:
+            self._get_access_token()
+
+        if not self.access_token:
+            logger.warning("⚠️ No access token available for callback API")
+            logger.info("💡 Trying to get token using credentials directly...")
+
+            # Fallback: tentar obter token diretamente
+            self.access_token = self._get_token_direct()
+
     def _get_token_direct(self) -> Optional[str]:
         """Get token using direct API call as fallback"""
         try:
-            # URL para obter token (pode variar conforme a API da StackSpot)
-            auth_url = "https://idm.stackspot.com/zup/oidc/oauth/token"
-
             data = {
                 'client_id': self.credentials.get('client_id'),
                 'client_secret': self.credentials.get('client_secret'),
                 'grant_type': 'client_credentials'
             }
 
-            response = requests.post(auth_url, data=data, timeout=30)
+            response = self.session.post(self.AUTH_URL, data=data, timeout=30)
 
             if response.status_code == 200:
                 token_data = response.json()
                 token = token_data.get('access_token')
-                print(f"✅ Token obtained via direct API call")
+                # Cache until shortly before the issuer-reported expiry so
+                # back-to-back calls skip the token exchange round-trip
+                expires_in = token_data.get('expires_in', self.DEFAULT_TOKEN_TTL)
+                self._token_expires_at = (
+                    time.monotonic() + max(float(expires_in) - 30.0, 60.0)
+                )
+                logger.info("✅ Token obtained via direct API call")
                 return token
             else:
-                print(f"❌ Failed to get token: {response.status_code}")
+                logger.error("❌ Failed to get token: %s", response.status_code)
                 return None
 
         except Exception as e:
-            print(f"❌ Error getting token directly: {e}")
+            logger.error("❌ Error getting token directly: %s", e)
             return None
 
     def _default_callback(self, event: dict) -> None:
         """Default callback for status updates"""
         status = event.get('progress', {}).get('status', 'UNKNOWN')
-        print(f"   Status: {status}")
+        logger.info("   Status: %s", status)
 
     def _extract_result(self, execution: dict) -> Optional[str]:
         """Extract result from execution response"""
@@ -222,10 +514,9 @@ class StackspotApiClient:
         result = execution.get('result')
 
         if isinstance(result, dict):
-            return (
-                    result.get('codigo_java') or
-                    result.get('code') or
-                    result.get('content')
+            return next(
+                (result[key] for key in self._RESULT_KEYS if result.get(key)),
+                None
             )
         elif isinstance(result, str):
             return result
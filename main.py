@@ -2,17 +2,81 @@
 Modern Jazz - Java Modernizator
 Main entry point
 """
+import argparse
+import io
+import logging
+import os
+import signal
 import sys
+import traceback
 
 from domain.enums.execution_mode import ExecutionMode
 from application.validators.setup_validator import SetupValidator
-from application.orchestrator import ExecutionOrchestrator
 
 # 🚀 Configuration
-DEV_MODE = False
 DEV_EXECUTION_ID = "01KC3WJQRRMWVNDMH9W0S89JWW"
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Modern Jazz - Java Modernizator"
+    )
+    parser.add_argument(
+        '--dev',
+        action='store_true',
+        help='Run in development mode (skip to Step 4)'
+    )
+    parser.add_argument(
+        '--execution-id',
+        default=DEV_EXECUTION_ID,
+        help='Execution ID to use in development mode'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only log warnings and errors (useful for batch/CI runs)'
+    )
+    parser.add_argument(
+        '--projects-from-stdin',
+        action='store_true',
+        help='Read already-cloned project paths from stdin, one per line, '
+             'and process each with the same orchestrator'
+    )
+    return parser.parse_args(argv)
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that lets the underlying buffer decide when to flush
+
+    The stock handler flushes after every record, turning each progress
+    line in the hot loop into its own write syscall. Records are still
+    flushed by logging.shutdown() at exit and whenever the 64 KB buffer
+    fills.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+def setup_logging(quiet: bool = False) -> None:
+    """Route pipeline progress through a buffered, message-only logger"""
+    stream = io.TextIOWrapper(
+        os.fdopen(sys.stdout.fileno(), 'wb', buffering=1 << 16, closefd=False),
+        encoding='utf-8',
+        write_through=False
+    )
+    handler = _BufferedStreamHandler(stream)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(
+        level=logging.WARNING if quiet else logging.INFO,
+        handlers=[handler]
+    )
+
+
 def print_header() -> None:
     """Print application header"""
     print("🎵 Modern Jazz - Java Modernizator".center(60, "="))
@@ -54,6 +118,18 @@ def print_results(result, mode: ExecutionMode) -> None:
     print("\n" + "=" * 60)
 
 
+def install_sigint_handler() -> None:
+    """Install Ctrl-C handler that cancels in-flight polling immediately"""
+    from infrastructure.stackspot_client import StackspotApiClient
+
+    def handle_sigint(signum, frame):
+        print("\n🛑 Cancellation requested, stopping active polling...")
+        StackspotApiClient.cancel_all()
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGINT, handle_sigint)
+
+
 def main() -> int:
     """
     Main execution function
@@ -61,11 +137,14 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
+    args = parse_args()
+    setup_logging(quiet=args.quiet)
     print_header()
+    install_sigint_handler()
 
     # Determine execution mode
-    mode = ExecutionMode.DEVELOPMENT if DEV_MODE else ExecutionMode.PRODUCTION
-    print_mode_info(mode, DEV_EXECUTION_ID if mode.is_dev else None)
+    mode = ExecutionMode.DEVELOPMENT if args.dev else ExecutionMode.PRODUCTION
+    print_mode_info(mode, args.execution_id if mode.is_dev else None)
 
     # Validate setup
     validator = SetupValidator(dev_mode=mode.is_dev)
@@ -74,11 +153,34 @@ def main() -> int:
         return 1
 
     try:
+        # Imported here so dev mode and failed validation skip the full
+        # pipeline import chain (steps, SDK client, file services)
+        from application.orchestrator import ExecutionOrchestrator
+
         # Execute orchestrated flow
         orchestrator = ExecutionOrchestrator(
             mode=mode,
-            dev_execution_id=DEV_EXECUTION_ID if mode.is_dev else None
+            dev_execution_id=args.execution_id if mode.is_dev else None
         )
+
+        if args.projects_from_stdin:
+            # One orchestrator handles the whole batch, reusing the auth
+            # token and HTTP session across projects
+            exit_code = 0
+            for line in sys.stdin:
+                project_path = line.strip()
+                if not project_path:
+                    continue
+
+                print(f"\n📦 Processing project: {project_path}")
+                result = orchestrator.execute(project_path=project_path)
+                print_results(result, mode)
+
+                if not result.success:
+                    exit_code = 1
+
+            return exit_code
+
         result = orchestrator.execute()
 
         # Print results
@@ -86,9 +188,12 @@ def main() -> int:
 
         return 0 if result.success else 1
 
+    except KeyboardInterrupt:
+        print("\n🛑 Execution cancelled by user")
+        return 1
+
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
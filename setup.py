@@ -3,21 +3,31 @@ Setup script to validate and configure the project
 """
 from pathlib import Path
 import json
+import os
 import sys
 
 
-def check_secrets_file():
+def _scan_project_root():
+    """List the project root once: one readdir instead of one stat per check"""
+    project_root = Path(__file__).parent
+    return {entry.name: entry for entry in os.scandir(project_root)}
+
+
+def check_secrets_file(entries=None):
     """Check if secrets.json exists and is valid"""
     project_root = Path(__file__).parent
     secrets_path = project_root / 'secrets.json'
     example_path = project_root / 'secrets-example.json'
 
+    if entries is None:
+        entries = _scan_project_root()
+
     print("🔍 Checking secrets configuration...")
 
-    if not secrets_path.exists():
+    if 'secrets.json' not in entries:
         print(f"❌ secrets.json not found at: {secrets_path}")
 
-        if example_path.exists():
+        if 'secrets-example.json' in entries:
             print(f"\n💡 Creating secrets.json from example...")
             secrets_path.write_text(example_path.read_text())
             print(f"✅ Created: {secrets_path}")
@@ -51,10 +61,8 @@ def check_secrets_file():
         return False
 
 
-def check_project_structure():
+def check_project_structure(entries=None):
     """Check if project structure is correct"""
-    project_root = Path(__file__).parent
-
     required_dirs = [
         'application',
         'config',
@@ -62,12 +70,14 @@ def check_project_structure():
         'infrastructure'
     ]
 
+    if entries is None:
+        entries = _scan_project_root()
+
     print("\n🔍 Checking project structure...")
 
     all_exist = True
     for dir_name in required_dirs:
-        dir_path = project_root / dir_name
-        if dir_path.exists():
+        if dir_name in entries and entries[dir_name].is_dir():
             print(f"✅ {dir_name}/")
         else:
             print(f"❌ {dir_name}/ not found")
@@ -95,10 +105,13 @@ def main():
     print("🚀 Java Modernizator - Setup Check\n")
     print("=" * 60)
 
+    # One directory scan shared by every path-based check
+    entries = _scan_project_root()
+
     checks = [
-        ("Project Structure", check_project_structure),
+        ("Project Structure", lambda: check_project_structure(entries)),
         ("Dependencies", check_dependencies),
-        ("Secrets Configuration", check_secrets_file),
+        ("Secrets Configuration", lambda: check_secrets_file(entries)),
     ]
 
     results = []